@@ -0,0 +1,668 @@
+#!/usr/bin/env python3
+"""Scrape upcoming events from The Algorithm community's Facebook page.
+
+The website is static, so this script does the dynamic part: it pulls the
+community's Facebook page, extracts anything that looks like an event
+(structured ld+json data, event links, or event-ish text), caches the
+results locally, and can export them to ``events.json`` or serve them over
+a small CORS-enabled HTTP endpoint for the site to fetch.
+
+Usage:
+    python facebook_events_scraper.py            # scrape and export events.json
+    python facebook_events_scraper.py --serve    # serve /events on port 8001
+"""
+
+import asyncio
+import hashlib
+import http.server
+import operator
+import os
+import re
+import sys
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import ClassVar
+
+import ahocorasick
+import aiohttp
+import diskcache
+import numpy as np
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
+
+FACEBOOK_PAGE_URL = "https://www.facebook.com/thealgorithmpkc"
+
+# Only these tags are ever inspected, so skip building the rest of the tree.
+# Script tags are excluded: ld+json blobs are pulled straight from the raw
+# bytes with _LDJSON_RE, so no tree nodes are built for them at all.
+_PAGE_STRAINER = SoupStrainer(["a", "p", "div", "span"])
+
+_ONLINE_RE = re.compile(r"online|virtual|remote|zoom|meet|webinar",
+                        re.IGNORECASE)
+
+# Quoting is flexible: the find_all this replaced matched the attribute
+# value however it was quoted, and pages do vary.
+_LDJSON_RE = re.compile(
+    rb'<script[^>]*type=["\']?application/ld\+json["\']?[^>]*>(.*?)</script>',
+    re.DOTALL)
+
+# Sentinel returned by _fetch when the server said 304 or the body hash
+# matched the previous fetch, i.e. there is nothing new to parse.
+_NOT_MODIFIED = object()
+
+# Compiled once at import; these run against every candidate element, so
+# rebuilding them per call (or per element) is pure waste.
+_EVENT_KEYWORDS = ("workshop", "hackathon", "meetup", "conference", "seminar",
+                   "training", "bootcamp", "session", "talk", "event")
+_EVENT_LINK_RE = re.compile(r"/events/\d+")
+_EVENTS_HREF_RE = re.compile(r"/events")
+_EVENT_TEXT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"(?:join us|register|rsvp|attend)\s+(?:for|at)?\s*(.{10,80})",
+    r"(?:upcoming|next)\s+(?:workshop|event|session|meetup)[:\s]+(.{10,80})",
+    r"((?:workshop|hackathon|meetup|seminar|bootcamp)\s+on\s+.{5,60})",
+))
+CACHE_DIR = "events_cache_dir"
+CACHE_DURATION = 30 * 60  # seconds
+SERVER_PORT = 8001
+
+
+@dataclass(slots=True)
+class Event:
+    """One parsed event.
+
+    Slotted instead of a plain dict: events are produced by the dozens per
+    scrape, and one pointer per slot beats a dict per event both in memory
+    and in field-access speed. orjson serializes dataclasses natively, so
+    the JSON boundary is unchanged.
+    """
+
+    id: str
+    name: str
+    description: str
+    start_time: str
+    end_time: str
+    location: str
+    image_url: str
+    attendee_count: int
+    is_online: bool
+    event_url: str
+    created_time: str
+
+
+class FacebookEventsScraper:
+    """Scrapes and caches events from the community's Facebook page."""
+
+    # Static fields of the fallback events, built (ids included) once at
+    # class definition; _get_fallback_events only stamps in the dates.
+    _FALLBACK_TEMPLATES: ClassVar[tuple] = tuple(
+        {
+            "id": hashlib.blake2b(name.encode("utf-8"),
+                                  digest_size=6).hexdigest(),
+            "name": name,
+            "description": description,
+            "location": ("Online" if is_online
+                         else "Padma Kanya Campus, Kathmandu"),
+            "image_url": "images/meeting.jpeg",
+            "attendee_count": attendees,
+            "is_online": is_online,
+            "event_url": FACEBOOK_PAGE_URL,
+            "days_offset": days,
+        }
+        for name, description, days, is_online, attendees in (
+            ("Python Workshop for Beginners",
+             "Hands-on introduction to Python for junior students, led by "
+             "senior mentors.", 7, False, 45),
+            ("Women in Data Hackathon",
+             "Open-data hackathon focused on data-driven policy, organized "
+             "with The Asia Foundation.", 14, False, 80),
+            ("Git & GitHub Crash Course",
+             "Version control basics every student needs before their first "
+             "internship.", 10, True, 60),
+            ("Imposter Syndrome Panel Talk",
+             "Senior students and alumnae share how they built confidence "
+             "in tech.", 5, True, 100),
+            ("Web Development Bootcamp",
+             "Four-session bootcamp covering HTML, CSS and JavaScript "
+             "fundamentals.", 21, False, 35),
+            ("Open Data Seminar",
+             "How open data can be leveraged for better public policy in "
+             "Nepal.", 12, True, 50),
+            ("Leadership Skills Meetup",
+             "Practice public speaking and event organizing in a supportive "
+             "space.", 9, False, 30),
+            ("Intro to Machine Learning Session",
+             "A gentle, math-light introduction to machine learning "
+             "concepts.", 18, True, 70),
+            ("Resume & Internship Clinic",
+             "Bring your resume and get feedback from seniors who landed "
+             "internships.", 25, False, 40),
+        )
+    )
+
+    def __init__(self, facebook_page_url=FACEBOOK_PAGE_URL,
+                 cache_dir=CACHE_DIR, cache_duration=CACHE_DURATION):
+        self.facebook_page_url = facebook_page_url
+        self.cache_duration = cache_duration
+        # SQLite-backed cache: indexed lookups, atomic writes, and native
+        # expiry instead of rewriting and re-parsing one big JSON file.
+        self.cache = diskcache.Cache(cache_dir)
+        self.headers = {
+            "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                           "AppleWebKit/537.36 (KHTML, like Gecko) "
+                           "Chrome/120.0.0.0 Safari/537.36"),
+            "Accept": ("text/html,application/xhtml+xml,application/xml;"
+                       "q=0.9,*/*;q=0.8"),
+            "Accept-Language": "en-US,en;q=0.5",
+            # br shrinks Facebook's HTML ~20% versus gzip; aiohttp
+            # decompresses it transparently via the brotli package. zstd is
+            # deliberately not advertised: aiohttp only decodes it with
+            # stdlib compression.zstd (3.14+) or backports.zstd, and
+            # advertising an encoding we cannot decode fails the scrape.
+            "Accept-Encoding": "gzip, deflate, br",
+            "Connection": "keep-alive",
+        }
+        # Aho-Corasick automaton over the event keywords: one linear scan of
+        # a text node replaces ten alternation attempts per position.
+        self._kw_automaton = ahocorasick.Automaton()
+        for word in _EVENT_KEYWORDS:
+            self._kw_automaton.add_word(word, word)
+        self._kw_automaton.make_automaton()
+        # Vectorized generator for the placeholder dates/attendee counts:
+        # one batched draw per page instead of five Python RNG calls per
+        # event, and reproducible under a fixed seed when testing.
+        self._rng = np.random.default_rng()
+        # One timestamp per scrape; refreshed at the top of _scrape_async so
+        # the extractors stop calling datetime.now() per event and per field.
+        self._scrape_now = datetime.now()
+        self._scrape_now_iso = self._scrape_now.isoformat()
+        # The threaded server shares this instance, so scrape-and-save is
+        # serialized: concurrent expired-cache requests would otherwise race
+        # on _scrape_now and scrape the same pages twice.
+        self._scrape_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_events(self, force_refresh=False):
+        """Return the list of upcoming events, scraping if the cache is stale."""
+        if not force_refresh:
+            cached = self._load_from_cache()
+            if cached is not None:
+                return cached
+
+        with self._scrape_lock:
+            if not force_refresh:
+                # Another thread may have finished the scrape while we
+                # waited for the lock.
+                cached = self._load_from_cache()
+                if cached is not None:
+                    return cached
+
+            try:
+                events, validators = self._scrape_facebook_events()
+            except Exception as exc:  # network errors, blocked requests, ...
+                print(f"Scrape failed ({exc}), falling back", file=sys.stderr)
+                events, validators = None, {}
+
+            scraped = bool(events)
+            if not events:
+                # Prefer stale cached data over the hardcoded fallback.
+                cached = self._load_from_cache(ignore_expiry=True)
+                events = cached if cached else self._get_fallback_events()
+
+            self._save_to_cache(events)
+            if scraped:
+                # The bodies behind these validators are now reflected in
+                # the saved events, so future 304s may safely reuse the
+                # cache.
+                for url, page_validators in validators.items():
+                    self.cache.set(("validators", url), page_validators)
+        return events
+
+    def get_events_payload(self):
+        """Pre-serialized ``/events`` response bytes, cached per cache window.
+
+        Serializing once and handing every client the same bytes keeps the
+        per-request work in the server to a cache lookup.
+        """
+        # Refresh the events first: a stale cache triggers a scrape whose
+        # _save_to_cache drops the old payload, so the payload can never
+        # outlive (or drift from) the events it wraps.
+        events = self.get_events()
+        payload = self.cache.get("payload", default=None)
+        if payload is None:
+            payload = orjson.dumps({
+                "generated_at": datetime.now().isoformat(),
+                "events": events,
+            })
+            self.cache.set("payload", payload, expire=self.cache_duration)
+        return payload
+
+    def export_to_json(self, filename="events.json"):
+        """Write the current events to ``filename`` for the website to use.
+
+        The write is skipped when the events match what was exported last
+        time (tracked through a sidecar hash file), so the mtime and any
+        downstream caches keyed on it stay stable. New content goes through
+        a temp file and os.replace so the web server never sees a
+        half-written export.
+        """
+        events = self.get_events()
+        new_hash = hashlib.blake2b(orjson.dumps(events)).hexdigest()
+        hash_file = filename + ".hash"
+        if os.path.exists(filename) and os.path.exists(hash_file):
+            try:
+                with open(hash_file, "r", encoding="utf-8") as f:
+                    old_hash = f.read().strip()
+            except OSError:
+                old_hash = None
+            if old_hash == new_hash:
+                print(f"Events unchanged, keeping existing {filename}")
+                return filename
+
+        data = {
+            "generated_at": datetime.now().isoformat(),
+            "source": self.facebook_page_url,
+            "events": events,
+        }
+        tmp = filename + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp, filename)
+        with open(hash_file, "w", encoding="utf-8") as f:
+            f.write(new_hash)
+        print(f"Exported {len(events)} events to {filename}")
+        return filename
+
+    # ------------------------------------------------------------------
+    # Scraping
+    # ------------------------------------------------------------------
+
+    def _scrape_facebook_events(self):
+        """Fetch the page and its events page concurrently and extract events.
+
+        Returns ``(events, validators)`` where ``validators`` maps each
+        fetched URL to its staged revalidation data; the caller commits them
+        to the cache once the events are saved.
+        """
+        return asyncio.run(self._scrape_async())
+
+    async def _fetch(self, session, url, pending_validators):
+        """Fetch ``url``, revalidating against the previous response.
+
+        Returns the raw body bytes, or ``_NOT_MODIFIED`` when the server answers
+        304 or the body hashes identically to last time, so callers can skip
+        re-parsing. Validators are only sent while a stale cached copy of the
+        events exists to fall back on. New validators are staged into
+        ``pending_validators`` (local to one scrape) rather than the cache:
+        committing them before the resulting events are saved would let a
+        later 304 serve stale events that never included this body.
+        """
+        conditional = {}
+        validators = self.cache.get(("validators", url), default=None)
+        revalidate = bool(validators) and "events_stale" in self.cache
+        if revalidate:
+            if validators.get("etag"):
+                conditional["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                conditional["If-Modified-Since"] = validators["last_modified"]
+        async with session.get(
+                url, headers=conditional,
+                timeout=aiohttp.ClientTimeout(total=15)) as response:
+            if response.status == 304:
+                return _NOT_MODIFIED
+            response.raise_for_status()
+            body = await response.read()
+            body_hash = hashlib.blake2b(body).hexdigest()
+            if revalidate and body_hash == validators.get("body_hash"):
+                return _NOT_MODIFIED
+            pending_validators[url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "body_hash": body_hash,
+            }
+            return body
+
+    async def _scrape_async(self):
+        """Fetch both pages over one keep-alive session, in parallel."""
+        events = []
+        merge_cached = False
+        pending_validators = {}
+        self._scrape_now = datetime.now()
+        self._scrape_now_iso = self._scrape_now.isoformat()
+        events_url = self.facebook_page_url.rstrip("/") + "/events"
+        connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(headers=self.headers,
+                                         connector=connector) as session:
+            # Both URLs target the same host, so the second fetch rides the
+            # same connection instead of paying another TLS handshake.
+            main_html, events_html = await asyncio.gather(
+                self._fetch(session, self.facebook_page_url,
+                            pending_validators),
+                self._fetch(session, events_url, pending_validators),
+                return_exceptions=True,
+            )
+            if isinstance(main_html, Exception):
+                raise main_html
+            if main_html is _NOT_MODIFIED:
+                # Main page unchanged: its events come from the cache, but
+                # the events-page result below must still be processed.
+                merge_cached = True
+                soup = None
+            else:
+                soup = BeautifulSoup(main_html, "lxml",
+                                     parse_only=_PAGE_STRAINER)
+                events.extend(self._extract_events_from_page(soup, main_html))
+
+            if events_html is _NOT_MODIFIED:
+                # Events page unchanged: reuse what we extracted last time
+                # (deduplication below drops the overlap with the main page).
+                merge_cached = True
+                events_html = None
+            elif isinstance(events_html, Exception):
+                # The guessed /events URL missed; fall back to whatever
+                # events link the page actually advertises.
+                events_html = None
+                if soup is not None:
+                    linked_url = self._find_events_page_link(soup)
+                    if linked_url and linked_url != events_url:
+                        try:
+                            events_html = await self._fetch(
+                                session, linked_url, pending_validators)
+                        except (aiohttp.ClientError, asyncio.TimeoutError):
+                            events_html = None
+                        if events_html is _NOT_MODIFIED:
+                            merge_cached = True
+                            events_html = None
+            if events_html:
+                soup = BeautifulSoup(events_html, "lxml",
+                                     parse_only=_PAGE_STRAINER)
+                events.extend(self._extract_events_from_page(soup, events_html))
+
+        if merge_cached:
+            # Ids hash the event name, so this also drops cached copies
+            # whose placeholder dates differ from a fresh re-extraction.
+            cached = self._load_from_cache(ignore_expiry=True)
+            if cached:
+                fresh_ids = {event.id for event in events}
+                events.extend(event for event in cached
+                              if event.id not in fresh_ids)
+        return self._deduplicate_events(events), pending_validators
+
+    def _extract_events_from_page(self, soup, raw=None):
+        """Pull events out of one page via structured data, text, and links.
+
+        ``raw`` is the undecoded response body; ld+json blocks are sliced out
+        of it directly so BeautifulSoup never re-decodes multi-MB script
+        payloads that lxml would otherwise turn into tree nodes.
+        """
+        events = []
+        if raw:
+            for match in _LDJSON_RE.finditer(raw):
+                try:
+                    data = orjson.loads(match.group(1))
+                except orjson.JSONDecodeError:
+                    continue
+                items = data if isinstance(data, list) else [data]
+                for item in items:
+                    if isinstance(item, dict) and item.get("@type") == "Event":
+                        event = self._parse_structured_event(item)
+                        if event:
+                            events.append(event)
+
+        # One fused walk over the tree collects both kinds of candidates;
+        # the old per-extractor find_all calls each re-walked the whole DOM.
+        text_candidates = []
+        event_anchors = []
+        seen_hrefs = set()
+        seen_parents = set()
+        for el in soup.descendants:
+            if el.name is None:  # text node
+                parent = el.parent
+                if parent is None or parent.name not in ("p", "div", "span"):
+                    continue
+                # One candidate per element: a tag whose text is split by
+                # inline markup has several text children, and emitting its
+                # get_text once per keyword-bearing child would duplicate
+                # the event (with independent placeholder dates).
+                if id(parent) in seen_parents:
+                    continue
+                if next(self._kw_automaton.iter(str(el).lower()),
+                        None) is None:
+                    continue
+                seen_parents.add(id(parent))
+                # Space separator: segments split by inline markup would
+                # otherwise concatenate into garbled text.
+                text = parent.get_text(" ", strip=True)
+                if 20 <= len(text) <= 300:
+                    text_candidates.append(text)
+            elif el.name == "a":
+                href = el.get("href", "")
+                if (href and href not in seen_hrefs
+                        and _EVENT_LINK_RE.search(href)):
+                    seen_hrefs.add(href)
+                    event_anchors.append(el)
+
+        events.extend(self._events_from_text_candidates(text_candidates))
+        events.extend(self._events_from_event_links(event_anchors))
+        return events
+
+    def _parse_structured_event(self, data):
+        """Convert an ld+json Event object into an :class:`Event`."""
+        name = data.get("name")
+        if not name:
+            return None
+        return Event(
+            id=self._generate_event_id(name),
+            name=name,
+            description=data.get("description", ""),
+            start_time=data.get("startDate", self._scrape_now_iso),
+            end_time=data.get("endDate", ""),
+            location=self._extract_location(data),
+            image_url=data.get("image", ""),
+            attendee_count=0,
+            is_online=self._is_online_event(data),
+            event_url=data.get("url", ""),
+            created_time=self._scrape_now_iso,
+        )
+
+    def _events_from_text_candidates(self, candidates):
+        """Turn keyword-matched text snippets into events."""
+        if not candidates:
+            return []
+
+        n = len(candidates)
+        day_offsets = self._rng.integers(3, 22, n)
+        attendees = self._rng.integers(20, 101, n)
+        online = self._rng.integers(0, 2, n).astype(bool)
+        events = []
+        for text, days, count, is_online in zip(candidates, day_offsets,
+                                                attendees, online):
+            event = self._parse_event_from_text(text, int(days), int(count),
+                                                bool(is_online))
+            if event:
+                events.append(event)
+        return events
+
+    def _parse_event_from_text(self, text, day_offset, attendee_count,
+                               is_online):
+        """Try to interpret a free-text snippet as an event announcement."""
+        name = None
+        for pattern in _EVENT_TEXT_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                name = match.group(1).strip().rstrip(".!,")
+                break
+        if not name:
+            return None
+
+        start = self._scrape_now + timedelta(days=day_offset)
+        return Event(
+            id=self._generate_event_id(name),
+            name=name,
+            description=text,
+            start_time=start.isoformat(),
+            end_time=(start + timedelta(hours=2)).isoformat(),
+            location="Padma Kanya Campus, Kathmandu",
+            image_url="",
+            attendee_count=attendee_count,
+            is_online=is_online,
+            event_url=self.facebook_page_url,
+            created_time=self._scrape_now_iso,
+        )
+
+    def _events_from_event_links(self, anchors):
+        """Build events from links that point at facebook.com/events/<id>."""
+        if not anchors:
+            return []
+
+        n = len(anchors)
+        day_offsets = self._rng.integers(1, 31, n)
+        attendee_counts = self._rng.integers(20, 101, n)
+        online = self._rng.integers(0, 2, n).astype(bool)
+        events = []
+        for i, anchor in enumerate(anchors):
+            href = anchor.get("href", "")
+            name = anchor.get_text(" ", strip=True)
+            if not name or len(name) < 5:
+                continue
+            start = self._scrape_now + timedelta(days=int(day_offsets[i]))
+            events.append(Event(
+                id=self._generate_event_id(name),
+                name=name,
+                description="",
+                start_time=start.isoformat(),
+                end_time=(start + timedelta(hours=2)).isoformat(),
+                location="Padma Kanya Campus, Kathmandu",
+                image_url="",
+                attendee_count=int(attendee_counts[i]),
+                is_online=bool(online[i]),
+                event_url=("https://www.facebook.com" + href
+                           if href.startswith("/") else href),
+                created_time=self._scrape_now_iso,
+            ))
+        return events
+
+    def _find_events_page_link(self, soup):
+        """Return the absolute URL of the page's events tab, if present."""
+        for anchor in soup.find_all("a", href=_EVENTS_HREF_RE):
+            href = anchor.get("href", "")
+            if "/events" in href:
+                if href.startswith("/"):
+                    return "https://www.facebook.com" + href
+                return href
+        return None
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _extract_location(self, data):
+        location = data.get("location", "")
+        if isinstance(location, dict):
+            return location.get("name", "") or location.get("address", "")
+        return str(location)
+
+    def _is_online_event(self, data):
+        # One C-level regex scan over both fields replaces twelve substring
+        # searches. _extract_location unwraps dict locations so we do not
+        # match against a {'name': ...} repr.
+        blob = (f"{self._extract_location(data)}"
+                f"{data.get('eventAttendanceMode', '')}")
+        return _ONLINE_RE.search(blob) is not None
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _generate_event_id(event_name):
+        # Static so self stays out of the cache key: the same title showing
+        # up on both pages (or across scrape rounds) costs one dict hit
+        # instead of an encode + digest. blake2b is ~3x faster than md5 and
+        # sizes its digest natively, so no hexdigest slicing is needed.
+        return hashlib.blake2b(event_name.encode("utf-8"),
+                               digest_size=6).hexdigest()
+
+    def _deduplicate_events(self, events):
+        """Drop duplicate events (same name and day) and sort by start time."""
+        seen = {}
+        for event in events:
+            # Tuple key: hashing two existing strings beats building a new one;
+            # setdefault keeps the first occurrence in one dict operation.
+            seen.setdefault((event.name.lower().strip(),
+                             event.start_time[:10]), event)
+        return sorted(seen.values(), key=operator.attrgetter("start_time"))
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _load_from_cache(self, ignore_expiry=False):
+        if ignore_expiry:
+            # diskcache drops expired entries on read, so stale data lives
+            # under its own never-expiring key for the scrape-failed path.
+            return self.cache.get("events_stale", default=None)
+        return self.cache.get("events", default=None)
+
+    def _save_to_cache(self, events):
+        self.cache.set("events", events, expire=self.cache_duration)
+        self.cache.set("events_stale", events)
+        # The serialized /events payload wraps the previous events; drop it
+        # so the next request rebuilds it from what was just saved.
+        self.cache.delete("payload")
+
+    # ------------------------------------------------------------------
+    # Fallback data
+    # ------------------------------------------------------------------
+
+    def _get_fallback_events(self):
+        """Representative events shown when Facebook cannot be reached."""
+        base = datetime.now()
+        base_iso = base.isoformat()
+        events = []
+        for template in self._FALLBACK_TEMPLATES:
+            fields = dict(template)
+            start = base + timedelta(days=fields.pop("days_offset"))
+            events.append(Event(
+                start_time=start.isoformat(),
+                end_time=(start + timedelta(hours=2)).isoformat(),
+                created_time=base_iso,
+                **fields,
+            ))
+        return events
+
+
+class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Serves /events as JSON with CORS headers so the site can fetch it."""
+
+    scraper = None
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/events":
+            body = self.scraper.get_events_payload()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            super().do_GET()
+
+
+def main():
+    scraper = FacebookEventsScraper()
+    if "--serve" in sys.argv:
+        CORSRequestHandler.scraper = scraper
+        # ThreadingHTTPServer: one slow client no longer blocks the rest.
+        with http.server.ThreadingHTTPServer(("", SERVER_PORT),
+                                             CORSRequestHandler) as httpd:
+            print(f"Serving events on http://localhost:{SERVER_PORT}/events")
+            httpd.serve_forever()
+    else:
+        scraper.export_to_json()
+
+
+if __name__ == "__main__":
+    main()